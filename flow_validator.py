@@ -5,7 +5,7 @@ Flow Validation Script for fastn Workflows
 This script validates fastn flow JSON files against common mistakes 
 and requirements outlined in VALIDATION_GUIDE.md.
 
-Usage: python3 flow_validator.py <flow_file.json>
+Usage: python3 flow_validator.py [--fail-fast] <flow_file.json>
 """
 
 import json
@@ -13,94 +13,241 @@ import sys
 import os
 import re
 from pathlib import Path
+from types import MappingProxyType
+
+# orjson is optional; it parses large flow files several times faster than the stdlib
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# google-re2 is optional; its linear-time matching helps when validating large flow corpora
+try:
+    import re2 as _regex
+except ImportError:
+    _regex = re
+
+# Valid status values
+VALID_STATUS_VALUES = frozenset({"DEPLOYED", "CONNECT", "PUBLISH"})
+INVALID_STATUS_VALUES = frozenset({"DRAFT", "ACTIVE", "INACTIVE", "PENDING"})
+
+# Required top-level fields
+REQUIRED_TOP_LEVEL_FIELDS = frozenset({
+    "clientId", "id", "name", "actionType", "inputName", 
+    "inputModelId", "outputModelId", "headerModelId", "resolver", "metaData"
+})
+
+# Additional fields that prevent "null" import errors
+ADDITIONAL_REQUIRED_FIELDS = MappingProxyType({
+    "newName": None,
+    "description": None, 
+    "chatWelcomeMessage": None,
+    "errorModelId": "",
+    "version": "1.0.1"
+})
+
+# Required model object fields
+REQUIRED_MODEL_FIELDS = frozenset({
+    "id", "name", "jsonSchema", "clientId", "version", "type", "preview",
+    "uiSchema", "isReadOnly", "imageUrl", "groupId", "resourceType", 
+    "deleted", "isCommunityCreated", "dataModel"
+})
+
+# All step type fields that must be explicitly declared (even as null)
+REQUIRED_STEP_NULL_FIELDS = frozenset({
+    "actionId", "inline", "function", "composite", "loop", "internalDatabase",
+    "aiAction", "mcpClient", "logger", "downLoadFile", "endLoop", "trigger",
+    "converter", "variables", "state", "conditional", "lambdaFunction",
+    "outputSchema", "prevStep", "enableDebug", "description", "debugBreakAfter",
+    "configuredStepSetting", "filter", "limit", "splitOut", "aggregate",
+    "merge", "aiAgent", "settings"
+})
+
+# Standard model IDs from base_flow.json
+STANDARD_MODEL_IDS = frozenset({
+    "07a1436d4df2fe3ee87d4fd70ea6a259",  # input model
+    "json",  # output model  
+    "9fed297b87c60d6808c16df827fc4407"   # header model
+})
+
+# Valid step types
+VALID_STEP_TYPES = frozenset({
+    "COMPOSITE", "INLINE", "CONDITIONAL", "LOOP", "VARIABLE", 
+    "INTERNAL_DB", "API", "LAMBDA"
+})
+
+# Valid conditional operations (enum values)
+VALID_CONDITIONAL_OPERATIONS = frozenset({
+    "DOES_NOT_CONTAIN", "LENGTH_EQ", "GREATER_THAN", "LESS_THAN", 
+    "NOT_EXISTS", "EQ_IGNORE_CASE", "EQ", "ENDS_WITH", "GREATER_THAN_OR_EQ", 
+    "LESS_THAN_OR_EQ", "STARTS_WITH", "DOES_NOT_START_WITH", "NOT_EQ", "NEQ", 
+    "MATCHES_REGEX", "EXISTS", "CONTAINS", "NONE", "DOES_NOT_MATCH_REGEX", 
+    "TYPE_OF", "DOES_NOT_END_WITH"
+})
+
+# Invalid operations that are commonly used by mistake
+INVALID_CONDITIONAL_OPERATIONS = MappingProxyType({
+    "GT": "GREATER_THAN",
+    "LT": "LESS_THAN", 
+    "GTE": "GREATER_THAN_OR_EQ",
+    "LTE": "LESS_THAN_OR_EQ",
+    "!=": "NOT_EQ",
+    "==": "EQ",
+    "EQUALS": "EQ",
+    "NOT_EQUALS": "NOT_EQ"
+})
+
+# Listing shown with every invalid/unknown operation report
+VALID_CONDITIONAL_OPERATIONS_TEXT = ", ".join(sorted(VALID_CONDITIONAL_OPERATIONS))
+
+# Precompiled patterns shared by all validator instances
+# NUL is excluded so matches never span the separator used by validate_data_references
+_BRACE_REF_RE = _regex.compile(r'{{[^}\x00]+\[[0-9]+\][^}\x00]*}}')
+_OUTPUT_INDEX_RE = _regex.compile(r'\.output\.[a-zA-Z]+\[[0-9]+\]')
+
+# Report entry prefixes, built once and shared by every entry
+_ERR_PREFIX = "❌ ERROR"
+_WARN_PREFIX = "⚠️  WARNING"
+_INFO_PREFIX = "ℹ️  INFO"
+
+# Characters behind the most common camelCase naming mistakes
+_NAME_SEPARATORS = frozenset(" -_")
+
+# Step fields whose objects can hold nested steps
+_NESTED_KEYS = ("composite", "loop")
+
+def _composite_next(step):
+    """Return the next id of a COMPOSITE step"""
+    return ((step.get("composite") or {}).get("next") or step.get("next"),)
+
+def _loop_next(step):
+    """Return the next id of a LOOP step"""
+    return ((step.get("loop") or {}).get("next") or step.get("next"),)
+
+def _conditional_next(step):
+    """Return the next ids of every branch of a CONDITIONAL step, plus its default"""
+    conditional = step.get("conditional") or {}
+    branches = tuple(expr.get("next") for expr in conditional.get("expressions") or ())
+    return branches + (conditional.get("next") or step.get("next"),)
+
+def _default_next(step):
+    """Return the next id of any other step type"""
+    return (step.get("next"),)
+
+# Outgoing step ids per step type; nested composite/loop steps form their own flow level
+_NEXT_EXTRACTORS = {
+    "COMPOSITE": _composite_next,
+    "LOOP": _loop_next,
+    "CONDITIONAL": _conditional_next,
+}
+
+def _is_camel_case(name):
+    """Check camelCase naming: starts with lowercase, only ASCII letters/numbers"""
+    if not name or not ('a' <= name[0] <= 'z'):
+        return False
+    rest = name[1:]
+    return not rest or (rest.isascii() and rest.isalnum())
+
+def _find_hardcoded_indices(code):
+    """Return every '[<digits>]' occurrence in code, scanning the string once"""
+    found = []
+    size = len(code)
+    i = 0
+    while True:
+        j = code.find('[', i)
+        if j < 0:
+            break
+        k = j + 1
+        while k < size and '0' <= code[k] <= '9':
+            k += 1
+        if k > j + 1 and k < size and code[k] == ']':
+            found.append(code[j:k + 1])
+            k += 1
+        i = k
+    return found
+
+def format_entries(entries):
+    """Format collected (prefix, location, message) report entries"""
+    return [f"{prefix} [{location}]: {message}" if location else f"{prefix}: {message}"
+            for prefix, location, message in entries]
+
+# Parsed JSON only holds exact dict/list/str objects, so the tree walkers
+# compare types by identity instead of calling isinstance
+def _iter_nested(step):
+    """Yield (container key, nested steps) for each composite/loop holding steps"""
+    for key in _NESTED_KEYS:
+        container = step.get(key)
+        if type(container) is dict:
+            nested_steps = container.get("steps")
+            if nested_steps:
+                yield key, nested_steps
+
+def _top_level_step_ids(steps):
+    """Return the ids of the top-level steps as a frozenset"""
+    return frozenset(step["id"] for step in steps if type(step) is dict and "id" in step)
+
+def _iter_nested_steps(step, step_path):
+    """Yield (index, nested step, label, parent path) for every step nested under step, depth-first"""
+    # Entries are (remaining (index, step) pairs of one steps list, that list's parent path)
+    stack = [(iter(enumerate(nested_steps)), f"{step_path}.{container}")
+             for container, nested_steps in reversed(list(_iter_nested(step)))]
+    while stack:
+        nested_iter, parent_path = stack[-1]
+        for i, nested_step in nested_iter:
+            if type(nested_step) is not dict:
+                continue
+            nested_id = nested_step.get("id")
+            step_label = nested_id if nested_id is not None else f"step_{i}"
+            yield i, nested_step, step_label, parent_path
+            # Descend before moving on to the next sibling
+            stack.extend((iter(enumerate(deeper_steps)), f"{parent_path}.{step_label}.{container}")
+                         for container, deeper_steps in reversed(list(_iter_nested(nested_step))))
+            break
+        else:
+            stack.pop()
+
+def _iter_strings(obj):
+    """Yield every string value of a parsed JSON tree in document order"""
+    stack = [obj]
+    while stack:
+        value = stack.pop()
+        if type(value) is dict:
+            stack.extend(reversed(value.values()))
+        elif type(value) is list:
+            stack.extend(reversed(value))
+        elif type(value) is str:
+            yield value
 
 class FlowValidator:
-    def __init__(self):
+    def __init__(self, fail_fast=False):
+        # Stop after the first validation pass that reports an error
+        self.fail_fast = fail_fast
         self.errors = []
         self.warnings = []
         self.info = []
         
-        # Valid status values
-        self.VALID_STATUS_VALUES = {"DEPLOYED", "CONNECT", "PUBLISH"}
-        self.INVALID_STATUS_VALUES = {"DRAFT", "ACTIVE", "INACTIVE", "PENDING"}
-        
-        # Required top-level fields
-        self.REQUIRED_TOP_LEVEL_FIELDS = {
-            "clientId", "id", "name", "actionType", "inputName", 
-            "inputModelId", "outputModelId", "headerModelId", "resolver", "metaData"
-        }
-        
-        # Additional fields that prevent "null" import errors
-        self.ADDITIONAL_REQUIRED_FIELDS = {
-            "newName": None,
-            "description": None, 
-            "chatWelcomeMessage": None,
-            "errorModelId": "",
-            "version": "1.0.1"
-        }
-        
-        # Required model object fields
-        self.REQUIRED_MODEL_FIELDS = {
-            "id", "name", "jsonSchema", "clientId", "version", "type", "preview",
-            "uiSchema", "isReadOnly", "imageUrl", "groupId", "resourceType", 
-            "deleted", "isCommunityCreated", "dataModel"
-        }
-        
-        # All step type fields that must be explicitly declared (even as null)
-        self.REQUIRED_STEP_NULL_FIELDS = {
-            "actionId", "inline", "function", "composite", "loop", "internalDatabase",
-            "aiAction", "mcpClient", "logger", "downLoadFile", "endLoop", "trigger",
-            "converter", "variables", "state", "conditional", "lambdaFunction",
-            "outputSchema", "prevStep", "enableDebug", "description", "debugBreakAfter",
-            "configuredStepSetting", "filter", "limit", "splitOut", "aggregate",
-            "merge", "aiAgent", "settings"
-        }
-        
-        # Standard model IDs from base_flow.json
-        self.STANDARD_MODEL_IDS = {
-            "07a1436d4df2fe3ee87d4fd70ea6a259",  # input model
-            "json",  # output model  
-            "9fed297b87c60d6808c16df827fc4407"   # header model
-        }
-        
-        # Valid step types
-        self.VALID_STEP_TYPES = {
-            "COMPOSITE", "INLINE", "CONDITIONAL", "LOOP", "VARIABLE", 
-            "INTERNAL_DB", "API", "LAMBDA"
-        }
-        
-        # Valid conditional operations (enum values)
-        self.VALID_CONDITIONAL_OPERATIONS = {
-            "DOES_NOT_CONTAIN", "LENGTH_EQ", "GREATER_THAN", "LESS_THAN", 
-            "NOT_EXISTS", "EQ_IGNORE_CASE", "EQ", "ENDS_WITH", "GREATER_THAN_OR_EQ", 
-            "LESS_THAN_OR_EQ", "STARTS_WITH", "DOES_NOT_START_WITH", "NOT_EQ", "NEQ", 
-            "MATCHES_REGEX", "EXISTS", "CONTAINS", "NONE", "DOES_NOT_MATCH_REGEX", 
-            "TYPE_OF", "DOES_NOT_END_WITH"
-        }
-        
-        # Invalid operations that are commonly used by mistake
-        self.INVALID_CONDITIONAL_OPERATIONS = {
-            "GT": "GREATER_THAN",
-            "LT": "LESS_THAN", 
-            "GTE": "GREATER_THAN_OR_EQ",
-            "LTE": "LESS_THAN_OR_EQ",
-            "!=": "NOT_EQ",
-            "==": "EQ",
-            "EQUALS": "EQ",
-            "NOT_EQUALS": "NOT_EQ"
-        }
+        # Step id -> outgoing next ids, built by validate_step_connectivity
+        self._adj = None
+
+    def reset(self):
+        """Clear collected results so the validator can be reused for another flow"""
+        # New lists, so results a caller kept from the previous flow stay intact
+        self.errors = []
+        self.warnings = []
+        self.info = []
 
     def add_error(self, message, location=""):
         """Add a critical error that will cause flow failure"""
-        self.errors.append(f"❌ ERROR{f' [{location}]' if location else ''}: {message}")
+        self.errors.append((_ERR_PREFIX, location, message))
     
     def add_warning(self, message, location=""):
         """Add a warning for potential issues"""
-        self.warnings.append(f"⚠️  WARNING{f' [{location}]' if location else ''}: {message}")
+        self.warnings.append((_WARN_PREFIX, location, message))
     
     def add_info(self, message, location=""):
         """Add informational message"""
-        self.info.append(f"ℹ️  INFO{f' [{location}]' if location else ''}: {message}")
+        self.info.append((_INFO_PREFIX, location, message))
 
     def validate_json_structure(self, data):
         """Check basic JSON structure requirements"""
@@ -120,14 +267,9 @@ class FlowValidator:
 
     def validate_top_level_fields(self, flow):
         """Validate required top-level fields"""
-        missing_fields = []
-        
-        for field in self.REQUIRED_TOP_LEVEL_FIELDS:
-            if field not in flow:
-                missing_fields.append(field)
-                
+        missing_fields = REQUIRED_TOP_LEVEL_FIELDS.difference(flow)
         if missing_fields:
-            self.add_error(f"Missing required top-level fields: {', '.join(missing_fields)}")
+            self.add_error(f"Missing required top-level fields: {', '.join(sorted(missing_fields))}")
             self.add_info("Copy these fields from base_flow.json template")
 
     def validate_status_field(self, flow):
@@ -137,81 +279,81 @@ class FlowValidator:
             return
             
         status = flow["status"]
-        if status not in self.VALID_STATUS_VALUES:
-            if status in self.INVALID_STATUS_VALUES:
+        if status not in VALID_STATUS_VALUES:
+            if status in INVALID_STATUS_VALUES:
                 self.add_error(f"Invalid status value '{status}'. This will cause deserialization failure!")
-                self.add_error(f"Valid status values are: {', '.join(self.VALID_STATUS_VALUES)}")
+                self.add_error(f"Valid status values are: {', '.join(VALID_STATUS_VALUES)}")
                 self.add_error("NEVER use 'DRAFT' - it's not a valid enum value")
             else:
-                self.add_error(f"Unknown status value '{status}'. Use one of: {', '.join(self.VALID_STATUS_VALUES)}")
+                self.add_error(f"Unknown status value '{status}'. Use one of: {', '.join(VALID_STATUS_VALUES)}")
 
     def validate_naming_patterns(self, flow):
-        """Validate that names follow proper camelCase naming conventions"""
+        """Validate that flow, step and nested step names follow camelCase naming conventions"""
+        self._check_flow_names(flow)
+        if "resolver" not in flow or "steps" not in flow["resolver"]:
+            return
+            
+        for i, step in enumerate(flow["resolver"]["steps"]):
+            if type(step) is not dict:
+                continue
+            step_id = step.get("id")
+            self._check_step_name(step, step_id, step.get("type"), f"Step {i + 1}")
+            for j, nested_step, _, parent_path in _iter_nested_steps(step, step_id if step_id is not None else f"step_{i}"):
+                self._check_nested_step_name(nested_step, j, parent_path)
+
+    def _check_flow_names(self, flow):
+        """Validate that the flow name and id follow camelCase (step names are checked by validate_steps)"""
         name = flow.get("name", "")
         flow_id = flow.get("id", "")
         
         # Validate flow name pattern: camelCase (starts with lowercase, only letters and numbers)
-        camel_case_pattern = r'^[a-z][a-zA-Z0-9]*$'
-        
-        if name and not re.match(camel_case_pattern, name):
+        name_is_camel_case = _is_camel_case(name)
+        if name and not name_is_camel_case:
             self.add_error(f"Invalid flow name '{name}' - must be camelCase (start with lowercase, only letters/numbers, no spaces/dashes/underscores)")
             self.add_info("Good examples: 'syncShopifyOrders', 'processPayments', 'updateInventory'")
             
         # Validate flow ID pattern (same as name)
-        if flow_id and not re.match(camel_case_pattern, flow_id):
+        if flow_id and not _is_camel_case(flow_id):
             self.add_error(f"Invalid flow id '{flow_id}' - must be camelCase (start with lowercase, only letters/numbers, no spaces/dashes/underscores)")
             self.add_info("Good examples: 'syncShopifyOrders', 'processPayments', 'updateInventory'")
             
-        # Check for common naming mistakes
-        if name:
-            if ' ' in name:
+        # Check for common naming mistakes (one scan of the name for separators)
+        if name and not name_is_camel_case:
+            separators = _NAME_SEPARATORS.intersection(name)
+            if ' ' in separators:
                 self.add_error(f"Flow name '{name}' contains spaces - use camelCase instead")
-            if '-' in name or '_' in name:
+            if '-' in separators or '_' in separators:
                 self.add_error(f"Flow name '{name}' contains dashes/underscores - use camelCase instead")
             if name[0].isupper():
                 self.add_error(f"Flow name '{name}' starts with uppercase - use camelCase (start with lowercase)")
                 
-        # Validate step names
-        self._validate_step_names(flow)
-        
-    def _validate_step_names(self, flow):
+    def _check_step_name(self, step, step_id, step_type, location):
         """Validate step naming conventions"""
-        if "resolver" not in flow or "steps" not in flow["resolver"]:
+        if not step_id:
+            self.add_error(f"Step missing 'id' field", location)
             return
             
-        steps = flow["resolver"]["steps"]
-        camel_case_pattern = r'^[a-z][a-zA-Z0-9]*$'
-        
-        for i, step in enumerate(steps):
-            step_id = step.get("id", "")
-            step_type = step.get("type", "")
-            location = f"Step {i + 1}"
+        # For COMPOSITE steps, check if name matches connector endpoint
+        if step_type == "COMPOSITE":
+            self._validate_composite_step_name(step, location)
+            return
             
-            if not step_id:
-                self.add_error(f"Step missing 'id' field", location)
-                continue
-                
-            # For COMPOSITE steps, check if name matches connector endpoint
-            if step_type == "COMPOSITE":
-                self._validate_composite_step_name(step, location)
-            else:
-                # For custom steps, validate camelCase
-                if not re.match(camel_case_pattern, step_id):
-                    self.add_error(f"Invalid step name '{step_id}' - must be camelCase (start with lowercase, only letters/numbers)", location)
-                    self.add_info("Good step names: 'transformData', 'validateInput', 'processOrders'")
-                    
-                # Check for common mistakes
-                if ' ' in step_id:
-                    self.add_error(f"Step name '{step_id}' contains spaces - use camelCase", location)
-                elif '-' in step_id:
-                    self.add_error(f"Step name '{step_id}' contains dashes - use camelCase", location) 
-                elif '_' in step_id:
-                    self.add_error(f"Step name '{step_id}' contains underscores - use camelCase", location)
-                elif step_id[0].isupper():
-                    self.add_error(f"Step name '{step_id}' starts with uppercase - use camelCase (start with lowercase)", location)
-                    
-            # Recursively check nested steps
-            self._validate_nested_step_names(step, f"{step_id}")
+        # For custom steps, validate camelCase
+        if _is_camel_case(step_id):
+            return
+        self.add_error(f"Invalid step name '{step_id}' - must be camelCase (start with lowercase, only letters/numbers)", location)
+        self.add_info("Good step names: 'transformData', 'validateInput', 'processOrders'")
+            
+        # Check for common mistakes (one scan of the id for separators)
+        separators = _NAME_SEPARATORS.intersection(step_id)
+        if ' ' in separators:
+            self.add_error(f"Step name '{step_id}' contains spaces - use camelCase", location)
+        elif '-' in separators:
+            self.add_error(f"Step name '{step_id}' contains dashes - use camelCase", location) 
+        elif '_' in separators:
+            self.add_error(f"Step name '{step_id}' contains underscores - use camelCase", location)
+        elif step_id[0].isupper():
+            self.add_error(f"Step name '{step_id}' starts with uppercase - use camelCase (start with lowercase)", location)
             
     def _validate_composite_step_name(self, step, location):
         """Validate COMPOSITE step names match connector endpoints"""
@@ -228,151 +370,103 @@ class FlowValidator:
                 self.add_info(f"Consider renaming step to '{connector_name}' to match connector")
                 
         # Still validate basic naming for COMPOSITE steps without function
-        camel_case_pattern = r'^[a-z][a-zA-Z0-9]*$'
-        if not re.match(camel_case_pattern, step_id):
+        if not _is_camel_case(step_id):
             self.add_error(f"Invalid COMPOSITE step name '{step_id}' - must be camelCase", location)
             
-    def _validate_nested_step_names(self, step, parent_path):
-        """Validate names in nested steps (COMPOSITE and LOOP steps)"""
-        camel_case_pattern = r'^[a-z][a-zA-Z0-9]*$'
-        
-        # Check COMPOSITE nested steps
-        if step.get("type") == "COMPOSITE" and "composite" in step:
-            composite = step["composite"]
-            if "steps" in composite:
-                for i, nested_step in enumerate(composite["steps"]):
-                    nested_id = nested_step.get("id", "")
-                    nested_type = nested_step.get("type", "")
-                    location = f"{parent_path}.composite.steps[{i}]"
-                    
-                    if nested_id and not re.match(camel_case_pattern, nested_id):
-                        self.add_error(f"Invalid nested step name '{nested_id}' - must be camelCase", location)
-                        
-        # Check LOOP nested steps  
-        elif step.get("type") == "LOOP" and "loop" in step:
-            loop = step["loop"]
-            if "steps" in loop:
-                for i, nested_step in enumerate(loop["steps"]):
-                    nested_id = nested_step.get("id", "")
-                    nested_type = nested_step.get("type", "")
-                    location = f"{parent_path}.loop.steps[{i}]"
-                    
-                    if nested_id and not re.match(camel_case_pattern, nested_id):
-                        self.add_error(f"Invalid nested step name '{nested_id}' - must be camelCase", location)
-                        
-                    # Recursively check deeper nesting
-                    self._validate_nested_step_names(nested_step, f"{parent_path}.loop.{nested_id}")
-    
+    def validate_step_null_fields(self, flow):
+        """Validate that all steps have explicit null field declarations"""
+        for i, step in enumerate(flow.get("resolver", {}).get("steps", [])):
+            if type(step) is not dict:
+                continue
+            step_id = step.get("id")
+            step_label = step_id if step_id is not None else f"step_{i}"
+            self._check_null_fields(step, step_label, step.get("type"))
+            for _, nested_step, nested_label, parent_path in _iter_nested_steps(step, step_label):
+                self._check_null_fields(nested_step, nested_label, nested_step.get("type"), parent_path)
+
+    def _check_null_fields(self, step, step_label, step_type, parent_path=None):
+        """Report step-type fields a step does not declare (as null)"""
+        missing_fields = REQUIRED_STEP_NULL_FIELDS.difference(step)
+        if not missing_fields:
+            return
+        type_label = step_type if step_type is not None else 'UNKNOWN'
+        if parent_path is None:
+            self.add_error(f"Step '{step_label}' ({type_label}) missing required null fields: {sorted(missing_fields)}")
+            self.add_info(f"Steps must explicitly declare ALL step-type fields as null, even if unused")
+        else:
+            self.add_error(f"Nested step '{parent_path}.{step_label}' ({type_label}) missing required null fields: {sorted(missing_fields)}")
+
     def validate_conditional_operations(self, flow):
         """Validate conditional step operations use correct enum values"""
         if "resolver" not in flow or "steps" not in flow["resolver"]:
             return
             
         for i, step in enumerate(flow["resolver"]["steps"]):
-            if step.get("type") == "CONDITIONAL" and "conditional" in step:
-                conditional = step["conditional"]
-                if "expressions" in conditional:
-                    for j, expression in enumerate(conditional["expressions"]):
-                        if "operation" in expression:
-                            operation = expression["operation"]
-                            
-                            # Check for invalid operations 
-                            if operation in self.INVALID_CONDITIONAL_OPERATIONS:
-                                correct_op = self.INVALID_CONDITIONAL_OPERATIONS[operation]
-                                self.add_error(f"Invalid conditional operation '{operation}' in step {i+1}, expression {j+1}")
-                                self.add_error(f"Use '{correct_op}' instead of '{operation}'")
-                                self.add_info("Valid operations: " + ", ".join(sorted(self.VALID_CONDITIONAL_OPERATIONS)))
-                            
-                            # Check for unknown operations
-                            elif operation not in self.VALID_CONDITIONAL_OPERATIONS:
-                                self.add_error(f"Unknown conditional operation '{operation}' in step {i+1}, expression {j+1}")
-                                self.add_info("Valid operations: " + ", ".join(sorted(self.VALID_CONDITIONAL_OPERATIONS)))
-    
-    def validate_query_executor_structure(self, obj, location=""):
-        """Recursively validate queryExecutor structures have required children arrays"""
-        if not isinstance(obj, dict):
+            if type(step) is dict:
+                self._check_conditional_operations(step, step.get("type"), i)
+
+    def _check_conditional_operations(self, step, step_type, index):
+        """Validate conditional step operations use correct enum values"""
+        if step_type != "CONDITIONAL" or not isinstance(step.get("conditional"), dict):
             return
             
-        # Check if this is a queryExecutor value object
-        if "returnLiteral" in obj and "symbolOrIndex" in obj and "version" in obj:
-            if "children" not in obj:
-                self.add_error(f"Missing 'children' array in queryExecutor structure{' at ' + location if location else ''}")
-                self.add_error("All queryExecutor value objects must have a 'children' array (can be empty)")
-            else:
-                # Recursively check children
-                children = obj.get("children", [])
-                for i, child in enumerate(children):
-                    if "value" in child:
-                        child_location = f"{location}.children[{i}]" if location else f"children[{i}]"
-                        self.validate_query_executor_structure(child["value"], child_location)
-        
-        # Recursively check all nested objects
-        for key, value in obj.items():
-            if isinstance(value, dict):
-                self.validate_query_executor_structure(value, f"{location}.{key}" if location else key)
-            elif isinstance(value, list):
-                for i, item in enumerate(value):
-                    if isinstance(item, dict):
-                        self.validate_query_executor_structure(item, f"{location}.{key}[{i}]" if location else f"{key}[{i}]")
+        for j, expression in enumerate(step["conditional"].get("expressions", [])):
+            if "operation" not in expression:
+                continue
+            operation = expression["operation"]
+            
+            # Check for invalid operations (mapping values are never None)
+            correct_op = INVALID_CONDITIONAL_OPERATIONS.get(operation)
+            if correct_op is not None:
+                self.add_error(f"Invalid conditional operation '{operation}' in step {index+1}, expression {j+1}")
+                self.add_error(f"Use '{correct_op}' instead of '{operation}'")
+                self.add_info("Valid operations: " + VALID_CONDITIONAL_OPERATIONS_TEXT)
+            
+            # Check for unknown operations
+            elif operation not in VALID_CONDITIONAL_OPERATIONS:
+                self.add_error(f"Unknown conditional operation '{operation}' in step {index+1}, expression {j+1}")
+                self.add_info("Valid operations: " + VALID_CONDITIONAL_OPERATIONS_TEXT)
+    
+    def validate_query_executor_structure(self, root, location="", in_query_executor=False):
+        """Validate queryExecutor structures have required children arrays (iterative walk)
+
+        Pass in_query_executor=True when root is itself a queryExecutor subtree.
+        """
+        # Entries are (object, location, inside a queryExecutor subtree)
+        stack = [(root, location, in_query_executor)]
+        while stack:
+            obj, location, in_query_executor = stack.pop()
+            if type(obj) is not dict:
+                continue
+                
+            # Nested objects to visit, in document order
+            pending = []
+            
+            # Value objects only live under 'queryExecutor' keys, so other dicts skip the marker probes
+            if in_query_executor and "returnLiteral" in obj and "symbolOrIndex" in obj and "version" in obj:
+                if "children" not in obj:
+                    self.add_error(f"Missing 'children' array in queryExecutor structure{' at ' + location if location else ''}")
+                    self.add_error("All queryExecutor value objects must have a 'children' array (can be empty)")
+            
+            # Check all nested objects; children[i].value is reached through the children list
+            for key, value in obj.items():
+                nested_query_executor = in_query_executor or key == "queryExecutor"
+                if type(value) is dict:
+                    pending.append((value, f"{location}.{key}" if location else key, nested_query_executor))
+                elif type(value) is list:
+                    for i, item in enumerate(value):
+                        if type(item) is dict:
+                            pending.append((item, f"{location}.{key}[{i}]" if location else f"{key}[{i}]", nested_query_executor))
+                            
+            stack.extend(reversed(pending))
 
     def validate_import_required_fields(self, flow):
         """Validate additional fields required for successful import"""
-        for field, default_value in self.ADDITIONAL_REQUIRED_FIELDS.items():
+        for field, default_value in ADDITIONAL_REQUIRED_FIELDS.items():
             if field not in flow:
                 self.add_warning(f"Missing '{field}' field - may cause import issues")
                 self.add_info(f"Add '{field}': {default_value if default_value is not None else 'null'} to prevent 'null' import errors")
 
-    def validate_step_null_fields(self, flow):
-        """Validate that all steps have explicit null field declarations"""
-        resolver = flow.get("resolver", {})
-        steps = resolver.get("steps", [])
-        
-        for i, step in enumerate(steps):
-            step_id = step.get("id", f"step_{i}")
-            step_type = step.get("type", "UNKNOWN")
-            
-            # Check for missing null fields
-            missing_fields = []
-            for field in self.REQUIRED_STEP_NULL_FIELDS:
-                if field not in step:
-                    missing_fields.append(field)
-            
-            if missing_fields:
-                self.add_error(f"Step '{step_id}' ({step_type}) missing required null fields: {missing_fields}")
-                self.add_info(f"Steps must explicitly declare ALL step-type fields as null, even if unused")
-                
-            # Also check nested steps in composite/loop steps
-            composite = step.get("composite")
-            if composite and isinstance(composite, dict) and composite.get("steps"):
-                self._validate_nested_steps_null_fields(composite["steps"], f"{step_id}.composite")
-            
-            loop = step.get("loop")
-            if loop and isinstance(loop, dict) and loop.get("steps"):
-                self._validate_nested_steps_null_fields(loop["steps"], f"{step_id}.loop")
-
-    def _validate_nested_steps_null_fields(self, steps, parent_path):
-        """Helper to validate nested step null fields"""
-        for i, step in enumerate(steps):
-            step_id = step.get("id", f"step_{i}")
-            step_type = step.get("type", "UNKNOWN")
-            
-            missing_fields = []
-            for field in self.REQUIRED_STEP_NULL_FIELDS:
-                if field not in step:
-                    missing_fields.append(field)
-            
-            if missing_fields:
-                self.add_error(f"Nested step '{parent_path}.{step_id}' ({step_type}) missing required null fields: {missing_fields}")
-                
-            # Recursively check deeper nesting
-            composite = step.get("composite")
-            if composite and isinstance(composite, dict) and composite.get("steps"):
-                self._validate_nested_steps_null_fields(composite["steps"], f"{parent_path}.{step_id}.composite")
-            
-            loop = step.get("loop")
-            if loop and isinstance(loop, dict) and loop.get("steps"):
-                self._validate_nested_steps_null_fields(loop["steps"], f"{parent_path}.{step_id}.loop")
-
     def validate_model_objects(self, flow):
         """Validate model objects are not null and IDs match"""
         model_checks = [
@@ -405,8 +499,8 @@ class FlowValidator:
                 if flow[id_field] != model_obj["id"]:
                     self.add_error(f"{id_field} ('{flow[id_field]}') doesn't match {model_field}.id ('{model_obj['id']}')")
 
-    def validate_steps(self, flow):
-        """Validate step structure and requirements"""
+    def validate_steps(self, flow, step_ids=None):
+        """Validate step structure, naming, null fields, operations and references in one pass"""
         if "resolver" not in flow or "steps" not in flow["resolver"]:
             self.add_warning("No steps found in resolver")
             return
@@ -416,8 +510,38 @@ class FlowValidator:
             self.add_error("Steps must be an array")
             return
             
+        if step_ids is None:
+            step_ids = _top_level_step_ids(steps)
         for i, step in enumerate(steps):
-            self.validate_single_step(step, f"Step {i}")
+            self._visit_step(step, i, step_ids)
+
+    def _visit_step(self, step, index, step_ids):
+        """Run every per-step check on a top-level step, then descend into nested steps"""
+        self.validate_single_step(step, f"Step {index}")
+        if type(step) is not dict:
+            return
+            
+        # Look up id/type once and hand them to every check
+        step_id = step.get("id")
+        step_type = step.get("type")
+        step_label = step_id if step_id is not None else f"step_{index}"
+        
+        self._check_step_name(step, step_id, step_type, f"Step {index + 1}")
+        
+        self._check_null_fields(step, step_label, step_type)
+        self._check_conditional_operations(step, step_type, index)
+        self._check_step_references(step, step_label, step_type, step_ids)
+        
+        # Also check names and null fields of steps nested in composite/loop steps
+        for i, nested_step, nested_label, parent_path in _iter_nested_steps(step, step_label):
+            self._check_nested_step_name(nested_step, i, parent_path)
+            self._check_null_fields(nested_step, nested_label, nested_step.get("type"), parent_path)
+
+    def _check_nested_step_name(self, step, index, parent_path):
+        """Validate the camelCase name of a step nested in a COMPOSITE or LOOP step"""
+        step_id = step.get("id")
+        if step_id and not _is_camel_case(step_id):
+            self.add_error(f"Invalid nested step name '{step_id}' - must be camelCase", f"{parent_path}.steps[{index}]")
 
     def validate_single_step(self, step, location):
         """Validate individual step structure"""
@@ -434,7 +558,7 @@ class FlowValidator:
             self.add_error("Missing 'id' field", location)
             
         step_type = step["type"]
-        if step_type not in self.VALID_STEP_TYPES:
+        if step_type not in VALID_STEP_TYPES:
             self.add_error(f"Invalid step type '{step_type}'", location)
             
         # Validate specific step types
@@ -475,20 +599,15 @@ class FlowValidator:
             return
             
         # Check for hardcoded array indices (common cause of bounds errors)
-        array_index_pattern = r'\[[0-9]+\]'
-        matches = re.findall(array_index_pattern, code)
+        matches = _find_hardcoded_indices(code)
         if matches:
             self.add_warning(f"Found hardcoded array indices {matches}. Consider using semantic references instead", location)
             
-        # Check for problematic references
-        problematic_patterns = [
-            (r'flattenedRow\[1\]', "This caused 'Index 1 out of bounds' error in past flows"),
-            (r'\.output\.[a-zA-Z]+\[[0-9]+\]', "Hardcoded array access may cause bounds errors")
-        ]
-        
-        for pattern, warning in problematic_patterns:
-            if re.search(pattern, code):
-                self.add_warning(f"{warning}", location)
+            # Check for problematic references (both need an indexed access)
+            if 'flattenedRow[1]' in code:
+                self.add_warning("This caused 'Index 1 out of bounds' error in past flows", location)
+            if _OUTPUT_INDEX_RE.search(code):
+                self.add_warning("Hardcoded array access may cause bounds errors", location)
 
     def validate_composite_step(self, step, location):
         """Validate COMPOSITE step structure"""
@@ -558,163 +677,117 @@ class FlowValidator:
 
     def validate_data_references(self, flow):
         """Check for problematic data references throughout the flow"""
-        flow_str = json.dumps(flow)
+        has_bounds_ref = False
+        ref_strings = []
+        
+        # Walk string values directly instead of serializing the whole flow
+        for value in _iter_strings(flow):
+            if "flattenOrderDetails.output.flattenedRow[1]" in value:
+                has_bounds_ref = True
+            if '{{' in value:
+                ref_strings.append(value)
+        
+        # One regex scan over all candidate strings, NUL-separated
+        problematic_refs = _BRACE_REF_RE.findall("\x00".join(ref_strings))
         
         # Check for the specific problematic reference that caused bounds errors
-        if "flattenOrderDetails.output.flattenedRow[1]" in flow_str:
+        if has_bounds_ref:
             self.add_error("Found problematic reference 'flattenOrderDetails.output.flattenedRow[1]' that causes bounds errors")
             self.add_error("This reference tries to access index [1] of an array that may only have 1 element")
             
         # Check for other hardcoded array indices in data references
-        problematic_refs = re.findall(r'{{[^}]+\[[0-9]+\][^}]*}}', flow_str)
         if problematic_refs:
             self.add_warning(f"Found hardcoded array indices in data references: {problematic_refs}")
             self.add_info("Consider using semantic field names instead of array positions")
 
-    def validate_step_connectivity(self, flow):
+    def validate_step_connectivity(self, flow, step_ids=None):
         """Validate that all steps are properly connected and reachable"""
-        if "resolver" not in flow or "steps" not in flow["resolver"]:
+        if step_ids is None and "resolver" in flow and "steps" in flow["resolver"]:
+            step_ids = _top_level_step_ids(flow["resolver"]["steps"])
+        if not self._check_reachability(flow, step_ids):
             return
             
+        # Validate next step references
+        for i, step in enumerate(flow["resolver"]["steps"]):
+            if type(step) is dict:
+                step_id = step.get("id")
+                self._check_step_references(step, step_id if step_id is not None else f"step_{i}", step.get("type"), step_ids)
+
+    def _check_reachability(self, flow, step_ids=None):
+        """Validate that all steps are reachable from the start step (validate_steps checks next references)
+
+        Returns False when there are no steps or no start step to check from.
+        """
+        if "resolver" not in flow or "steps" not in flow["resolver"]:
+            return False
+            
         steps = flow["resolver"]["steps"]
         start_step = flow["resolver"].get("start")
         
         if not start_step:
             self.add_error("Missing 'start' field in resolver - no entry point defined for the flow")
-            return
+            return False
             
-        # Build step lookup dictionary
-        step_dict = {}
-        all_step_ids = set()
-        
-        for step in steps:
-            if "id" in step:
-                step_dict[step["id"]] = step
-                all_step_ids.add(step["id"])
+        if step_ids is None:
+            step_ids = _top_level_step_ids(steps)
         
-        # Find all reachable steps
-        reachable_steps = set()
-        self._trace_reachable_steps(start_step, step_dict, reachable_steps)
+        # Find all reachable steps once per validated flow
+        self._build_adjacency(steps)
+        reachable_steps = self._trace_reachable_steps(start_step)
         
         # Check for unreachable steps
-        unreachable_steps = all_step_ids - reachable_steps
+        unreachable_steps = step_ids - reachable_steps
         if unreachable_steps:
             self.add_error(f"Found orphaned/unreachable steps: {', '.join(sorted(unreachable_steps))}")
             self.add_error("All steps must be connected and reachable from the start step")
             
         # Check if start step exists
-        if start_step not in step_dict:
+        if start_step not in step_ids:
             self.add_error(f"Start step '{start_step}' not found in steps list")
-            
-        # Validate next step references
+        return True
+
+    def _build_adjacency(self, steps):
+        """Map each top-level step id to the ids it can continue to, in one pass"""
+        self._adj = {}
         for step in steps:
-            step_id = step.get("id", "unknown")
-            self._validate_step_next_references(step, step_dict, step_id)
+            if type(step) is dict and "id" in step:
+                next_ids = _NEXT_EXTRACTORS.get(step.get("type"), _default_next)(step)
+                self._adj[step["id"]] = [next_id for next_id in next_ids if next_id]
+        return self._adj
 
-    def _trace_reachable_steps(self, step_id, step_dict, reachable_steps, visited=None):
-        """Recursively trace all reachable steps from a given step"""
-        if visited is None:
-            visited = set()
-            
-        if step_id in visited or step_id not in step_dict:
-            return
-            
-        visited.add(step_id)
-        reachable_steps.add(step_id)
-        
-        step = step_dict[step_id]
-        step_type = step.get("type", "")
-        
-        # Handle different step types and their navigation patterns
-        if step_type == "COMPOSITE":
-            # Composite steps have internal steps
-            composite = step.get("composite", {})
-            internal_steps = composite.get("steps", [])
-            internal_start = composite.get("start")
-            
-            # Build internal step dict
-            internal_step_dict = {}
-            for internal_step in internal_steps:
-                if "id" in internal_step:
-                    internal_step_dict[internal_step["id"]] = internal_step
-            
-            # Trace internal flow
-            if internal_start:
-                self._trace_reachable_steps(internal_start, internal_step_dict, reachable_steps, visited)
-            elif internal_steps:
-                # If no explicit start, assume first step
-                first_step = internal_steps[0]
-                if "id" in first_step:
-                    self._trace_reachable_steps(first_step["id"], internal_step_dict, reachable_steps, visited)
-            
-            # Follow composite step's next
-            next_step = composite.get("next") or step.get("next")
-            if next_step:
-                self._trace_reachable_steps(next_step, step_dict, reachable_steps, visited)
-                
-        elif step_type == "LOOP":
-            # Loop steps have internal steps and loop flow
-            loop = step.get("loop", {})
-            loop_steps = loop.get("steps", [])
-            loop_start = loop.get("start")
-            
-            # Build loop step dict  
-            loop_step_dict = {}
-            for loop_step in loop_steps:
-                if "id" in loop_step:
-                    loop_step_dict[loop_step["id"]] = loop_step
-            
-            # Trace loop internal flow
-            if loop_start:
-                self._trace_reachable_steps(loop_start, loop_step_dict, reachable_steps, visited)
-            
-            # Follow loop's next
-            next_step = loop.get("next") or step.get("next")
-            if next_step:
-                self._trace_reachable_steps(next_step, step_dict, reachable_steps, visited)
-                
-        elif step_type == "CONDITIONAL":
-            # Conditional steps have expressions with different next steps
-            conditional = step.get("conditional", {})
-            expressions = conditional.get("expressions", [])
-            
-            # Follow all expression branches
-            for expr in expressions:
-                expr_next = expr.get("next")
-                if expr_next:
-                    self._trace_reachable_steps(expr_next, step_dict, reachable_steps, visited)
-            
-            # Follow default next
-            default_next = conditional.get("next") or step.get("next")
-            if default_next:
-                self._trace_reachable_steps(default_next, step_dict, reachable_steps, visited)
-                
-        else:
-            # Regular steps - follow next
-            next_step = step.get("next")
-            if next_step:
-                self._trace_reachable_steps(next_step, step_dict, reachable_steps, visited)
+    def _trace_reachable_steps(self, start_id):
+        """Return every top-level step reachable from start_id (iterative DFS over _adj)"""
+        adj = self._adj
+        if start_id not in adj:
+            return frozenset()
+        # Steps are marked when pushed, so each one enters the stack at most once
+        reachable_steps = {start_id}
+        stack = [start_id]
+        while stack:
+            for next_id in adj[stack.pop()]:
+                if next_id in adj and next_id not in reachable_steps:
+                    reachable_steps.add(next_id)
+                    stack.append(next_id)
+        return frozenset(reachable_steps)
 
-    def _validate_step_next_references(self, step, step_dict, step_id):
+    def _check_step_references(self, step, step_id, step_type, step_ids):
         """Validate that next step references point to existing steps"""
-        step_type = step.get("type", "")
-        
         # Check main next field
         next_step = step.get("next")
-        if next_step and next_step not in step_dict:
+        if next_step and next_step not in step_ids:
             self.add_error(f"Step '{step_id}' references non-existent next step '{next_step}'")
             
         # Check type-specific next references
         if step_type == "COMPOSITE":
             composite = step.get("composite", {})
             comp_next = composite.get("next")
-            if comp_next and comp_next not in step_dict:
+            if comp_next and comp_next not in step_ids:
                 self.add_error(f"Composite step '{step_id}' references non-existent next step '{comp_next}'")
                 
         elif step_type == "LOOP":
             loop = step.get("loop", {})
             loop_next = loop.get("next")
-            if loop_next and loop_next not in step_dict:
+            if loop_next and loop_next not in step_ids:
                 self.add_error(f"Loop step '{step_id}' references non-existent next step '{loop_next}'")
                 
         elif step_type == "CONDITIONAL":
@@ -723,22 +796,21 @@ class FlowValidator:
             
             for i, expr in enumerate(expressions):
                 expr_next = expr.get("next")
-                if expr_next and expr_next not in step_dict:
+                if expr_next and expr_next not in step_ids:
                     self.add_error(f"Conditional step '{step_id}' expression {i} references non-existent next step '{expr_next}'")
                     
             cond_next = conditional.get("next") 
-            if cond_next and cond_next not in step_dict:
+            if cond_next and cond_next not in step_ids:
                 self.add_error(f"Conditional step '{step_id}' references non-existent default next step '{cond_next}'")
 
     def validate_flow_file(self, file_path):
         """Main validation method"""
-        self.errors = []
-        self.warnings = []
-        self.info = []
+        self.reset()
+        self._adj = None
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(file_path, 'rb') as f:
+                data = _json_loads(f.read())
         except json.JSONDecodeError as e:
             self.add_error(f"Invalid JSON: {e}")
             return False
@@ -755,64 +827,88 @@ class FlowValidator:
             
         flow = data[0]  # First flow in array
         
+        # Top-level step ids, built once and shared by the step and reachability passes
+        resolver = flow.get("resolver") if type(flow) is dict else None
+        steps = resolver.get("steps") if type(resolver) is dict else None
+        step_ids = _top_level_step_ids(steps) if type(steps) is list else None
+        
         # Run all validations
-        self.validate_top_level_fields(flow)
-        self.validate_import_required_fields(flow)
-        self.validate_naming_patterns(flow)
-        self.validate_status_field(flow)
-        self.validate_model_objects(flow)
-        self.validate_steps(flow)
-        self.validate_step_null_fields(flow)
-        self.validate_conditional_operations(flow)
-        self.validate_step_connectivity(flow)
-        self.validate_data_references(flow)
-        self.validate_query_executor_structure(flow, "flow")
+        for validate in (
+            self.validate_top_level_fields,
+            self.validate_import_required_fields,
+            self._check_flow_names,
+            self.validate_status_field,
+            self.validate_model_objects,
+            lambda flow: self.validate_steps(flow, step_ids),
+            lambda flow: self._check_reachability(flow, step_ids),
+            self.validate_data_references,
+            lambda flow: self.validate_query_executor_structure(flow, "flow"),
+        ):
+            validate(flow)
+            if self.fail_fast and self.errors:
+                return False
         
         return len(self.errors) == 0
 
     def print_report(self):
         """Print validation report"""
-        print("\n" + "="*60)
-        print("🔍 FASTN FLOW VALIDATION REPORT")
-        print("="*60)
+        # Build the whole report first and write it in one call
+        out = ["\n" + "="*60, "🔍 FASTN FLOW VALIDATION REPORT", "="*60]
         
         if self.errors:
-            print(f"\n💥 CRITICAL ERRORS ({len(self.errors)}):")
-            print("These WILL cause flow failure and must be fixed:")
-            for error in self.errors:
-                print(f"  {error}")
+            out.append(f"\n💥 CRITICAL ERRORS ({len(self.errors)}):")
+            out.append("These WILL cause flow failure and must be fixed:")
+            out.extend(f"  {error}" for error in format_entries(self.errors))
                 
         if self.warnings:
-            print(f"\n⚠️  WARNINGS ({len(self.warnings)}):")
-            print("These may cause issues and should be reviewed:")
-            for warning in self.warnings:
-                print(f"  {warning}")
+            out.append(f"\n⚠️  WARNINGS ({len(self.warnings)}):")
+            out.append("These may cause issues and should be reviewed:")
+            out.extend(f"  {warning}" for warning in format_entries(self.warnings))
                 
         if self.info:
-            print(f"\nℹ️  INFORMATION ({len(self.info)}):")
-            for info in self.info:
-                print(f"  {info}")
+            out.append(f"\nℹ️  INFORMATION ({len(self.info)}):")
+            out.extend(f"  {info}" for info in format_entries(self.info))
                 
-        print("\n" + "="*60)
+        out.append("\n" + "="*60)
         if not self.errors and not self.warnings:
-            print("✅ VALIDATION PASSED: Flow appears to be valid!")
+            out.append("✅ VALIDATION PASSED: Flow appears to be valid!")
         elif not self.errors:
-            print("✅ VALIDATION PASSED: Flow is valid but has warnings to review")
+            out.append("✅ VALIDATION PASSED: Flow is valid but has warnings to review")
         else:
-            print("❌ VALIDATION FAILED: Critical errors must be fixed before deployment")
-        print("="*60)
+            out.append("❌ VALIDATION FAILED: Critical errors must be fixed before deployment")
+        out.append("="*60)
+        sys.stdout.write("\n".join(out) + "\n")
+
+# Shared validator reused across validations; the rule sets are module constants
+_VALIDATOR_SINGLETON = None
+
+def get_validator(fail_fast=False):
+    """Return the shared FlowValidator with its previous results cleared"""
+    global _VALIDATOR_SINGLETON
+    if _VALIDATOR_SINGLETON is None:
+        _VALIDATOR_SINGLETON = FlowValidator()
+    else:
+        _VALIDATOR_SINGLETON.reset()
+    _VALIDATOR_SINGLETON.fail_fast = fail_fast
+    return _VALIDATOR_SINGLETON
 
 def main():
-    if len(sys.argv) != 2:
+    args = sys.argv[1:]
+    fail_fast = "--fail-fast" in args
+    args = [arg for arg in args if arg != "--fail-fast"]
+    
+    if len(args) != 1:
         print("Usage:")
-        print("  python3 flow_validator.py <flow_file.json>")
+        print("  python3 flow_validator.py [--fail-fast] <flow_file.json>")
+        print("\nOptions:")
+        print("  --fail-fast  Stop after the first validation pass that reports an error")
         print("\nExamples:")
         print("  python3 flow_validator.py flowExamples/shoppifyOrdersToGoogleSheet.json")
         print("  python3 flow_validator.py buildedByAI/send_email_flow.json")
-        print("  python3 flow_validator.py /path/to/your/flow.json")
+        print("  python3 flow_validator.py --fail-fast /path/to/your/flow.json")
         sys.exit(1)
 
-    flow_file = sys.argv[1]
+    flow_file = args[0]
     
     # Convert relative path to absolute for better error reporting
     if not os.path.isabs(flow_file):
@@ -820,7 +916,7 @@ def main():
     
     print(f"🔍 Validating flow: {flow_file}")
     
-    validator = FlowValidator()
+    validator = get_validator(fail_fast)
     is_valid = validator.validate_flow_file(flow_file)
     validator.print_report()
     
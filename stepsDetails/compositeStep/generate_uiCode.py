@@ -1,60 +1,84 @@
 import json
 import sys
-import subprocess
-import os
-
-def get_endpoint_details(endpoint_name, connector_file=None):
-    script_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'get_endpoint_details.py')
-    cmd = ['python3', script_path, endpoint_name]
-    if connector_file:
-        cmd.append(connector_file)
-        
-    result = subprocess.run(
-        cmd,
-        capture_output=True,
-        text=True
-    )
-    if result.returncode != 0:
-        print(f"Error getting endpoint details: {result.stderr}")
-        return None
-    
-    if not result.stdout.strip():
-        print(f"No endpoint data returned for '{endpoint_name}'")
-        return None
-        
-    return json.loads(result.stdout)
 
-def generate_ui_code_from_schema(schema, path_prefix=""):
-    target = {}
-    if "properties" in schema:
+# orjson is optional; it parses schemas and serializes UI code faster than the stdlib
+try:
+    import orjson
+    _loads = orjson.loads
+
+    def _write_json(obj):
+        # Hand orjson's bytes straight to the binary buffer, skipping the text codec
+        sys.stdout.flush()
+        sys.stdout.buffer.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2) + b"\n")
+        sys.stdout.buffer.flush()
+except ImportError:
+    _loads = json.loads
+
+    def _write_json(obj):
+        json.dump(obj, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+
+# Sibling module; the script directory is on sys.path when run directly
+from get_endpoint_details import get_endpoint_details
+
+# Field mapping defaults; each property copies this and fills in its own values.
+# Empty tuples are shared safely between copies and serialize as JSON arrays.
+_FIELD_TEMPLATE = {
+    "actionType": "map",
+    "target": "",
+    "targetType": "string",
+    "actions": (),
+    "enum": (),
+    "title": "",
+    "description": "",
+    "isRequred": False,
+    "default": "",
+    "autoEscape": "MANUAL",
+    "selected": False,
+    "byUser": False,
+    "path": "",
+    "field": "",
+    "position": (),
+    "key": ""
+}
+
+def _build_target(schema, path_prefix=""):
+    root = {}
+    # Each entry is a (sub)schema whose properties get mapped into target
+    stack = [(schema, root, path_prefix, path_prefix.split('.') if path_prefix else [])]
+    while stack:
+        schema, target, path_prefix, parent_position = stack.pop()
+        if "properties" not in schema:
+            continue
+        required = frozenset(schema.get("required") or ())
         for key, prop in schema["properties"].items():
             current_path = f"{path_prefix}.{key}" if path_prefix else key
-            target[key] = {
-                "actionType": "map",
-                "target": "",
-                "targetType": prop.get("type", "string"),
-                "actions": [],
-                "enum": prop.get("enum", []),
-                "title": prop.get("title", ""),
-                "description": prop.get("description", ""),
-                "isRequred": key in schema.get("required", []),
-                "default": prop.get("default", ""),
-                "autoEscape": "MANUAL",
-                "selected": False,
-                "byUser": False,
-                "path": current_path,
-                "field": path_prefix,
-                "position": current_path.split('.'),
-                "key": key
-            }
-            if prop.get("type") == "object":
-                target[key]["target"] = generate_ui_code_from_schema(prop, current_path)["target"]
-            elif prop.get("type") == "array":
+            position = parent_position + [key]
+            ptype = prop.get("type", "string")
+            node = target[key] = _FIELD_TEMPLATE.copy()
+            node["targetType"] = ptype
+            if "enum" in prop:
+                node["enum"] = prop["enum"]
+            node["title"] = prop.get("title", "")
+            node["description"] = prop.get("description", "")
+            node["isRequred"] = key in required
+            node["default"] = prop.get("default", "")
+            node["path"] = current_path
+            node["field"] = path_prefix
+            node["position"] = position
+            node["key"] = key
+            if ptype == "object":
+                node["target"] = {}
+                stack.append((prop, node["target"], current_path, position))
+            elif ptype == "array":
                 if "items" in prop and prop["items"].get("type") == "object":
-                     target[key]["items"] = generate_ui_code_from_schema(prop["items"], current_path)
+                    node["items"] = {"actionType": "map", "target": {}, "targetType": "object"}
+                    stack.append((prop["items"], node["items"]["target"], current_path, position))
+    return root
 
 
-    return {"actionType": "map", "target": target, "targetType": "object"}
+def generate_ui_code_from_schema(schema, path_prefix=""):
+    return {"actionType": "map", "target": _build_target(schema, path_prefix), "targetType": "object"}
 
 
 def main():
@@ -80,9 +104,9 @@ def main():
         else:
             request_schema_str = endpoint_details['contract']['action']['request']['schema']
 
-        request_schema = json.loads(request_schema_str)
+        request_schema = _loads(request_schema_str)
         ui_code = generate_ui_code_from_schema(request_schema)
-        print(json.dumps(ui_code, indent=2))
+        _write_json(ui_code)
         
     except KeyError as e:
         print(f"Error: Missing required field in endpoint details: {e}")
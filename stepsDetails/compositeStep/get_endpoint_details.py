@@ -1,7 +1,35 @@
+import copy
+import functools
 import json
 import re
 import sys
 import os
+import threading
+from collections import defaultdict
+
+# orjson is optional; it parses the multi-MB connector files several times faster than the stdlib
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+# "## <Connector>" heading followed, within the same section, by its details file.
+# Lines are skipped whole, so the "## " lookahead runs once per line, not per character.
+_CONNECTOR_SECTION_RE = re.compile(
+    r'^## ([^\n]+)\n(?:(?!## )[^\n]*\n)*?(?!## )[^\n]*?- \*\*Details File:\*\* `\./([^`]+)`',
+    re.MULTILINE,
+)
+
+_index_lock = threading.Lock()
+_index_key = None
+INDEX = defaultdict(list)
+
+@functools.lru_cache(maxsize=32)
+def _load_connector(path, mtime):
+    """Parse a connector JSON file; mtime is part of the key so edits are picked up."""
+    with open(path, 'rb') as jf:
+        return _loads(jf.read())
 
 def get_endpoint_details(endpoint_name, connector_file=None):
     """
@@ -13,7 +41,7 @@ def get_endpoint_details(endpoint_name, connector_file=None):
                                        If None, searches all connector files.
 
     Returns:
-        str: A JSON string containing the endpoint details, or an empty string if not found.
+        dict or None: A copy of the endpoint details, or None if not found or ambiguous.
     """
     script_dir = os.path.dirname(os.path.abspath(__file__))
     
@@ -22,90 +50,114 @@ def get_endpoint_details(endpoint_name, connector_file=None):
         json_file_path = os.path.join(script_dir, connector_file)
         if not os.path.exists(json_file_path):
             print(f"Error: {json_file_path} not found.")
-            return ""
+            return None
         
-        return _search_endpoint_in_file(json_file_path, endpoint_name)
+        result = _search_endpoint_in_file(json_file_path, endpoint_name)
+        if result is None:
+            print(f"Endpoint '{endpoint_name}' not found in {connector_file}.")
+            return None
+        # Copy so callers can't mutate the cached connector data
+        return copy.deepcopy(result)
     
-    # Otherwise, search in all connector files as before
+    # Otherwise, look the endpoint up across all connector files
     markdown_file_path = os.path.join(script_dir, 'connectorDetails.md')
 
     if not os.path.exists(markdown_file_path):
         print(f"Error: {markdown_file_path} not found.")
-        return ""
-
-    with open(markdown_file_path, 'r') as f:
-        content = f.read()
-
-    # Find the connector section that contains the endpoint
-    found_endpoints = []
-    for section in content.split('## '):
-        if f"- **Endpoints:**" in section and endpoint_name in section:
-            # Extract the JSON file path
-            match = re.search(r'- \*\*Details File:\*\* `\./(.*)`', section)
-            connector_name_match = re.search(r'^([^\n]+)', section.strip())
-            
-            if match and connector_name_match:
-                json_file_name = match.group(1)
-                connector_name = connector_name_match.group(1)
-                json_file_path = os.path.join(script_dir, json_file_name)
-
-                if not os.path.exists(json_file_path):
-                    print(f"Error: {json_file_path} not found.")
-                    continue
-
-                result = _search_endpoint_in_file(json_file_path, endpoint_name, return_data=True)
-                if result:
-                    found_endpoints.append({
-                        'connector': connector_name,
-                        'file': json_file_name,
-                        'data': result
-                    })
+        return None
+
+    found_endpoints = [
+        {'connector': connector_name, 'file': json_file_name, 'data': item}
+        for connector_name, json_file_name, item in _build_endpoint_index().get(endpoint_name, [])
+    ]
 
     if len(found_endpoints) == 0:
         print(f"Endpoint '{endpoint_name}' not found in any connector.")
-        return ""
+        return None
     elif len(found_endpoints) == 1:
-        print(json.dumps(found_endpoints[0]['data'], indent=2))
-        return ""
+        return copy.deepcopy(found_endpoints[0]['data'])
     else:
         print(f"Multiple connectors found with endpoint '{endpoint_name}':")
         for i, ep in enumerate(found_endpoints):
             print(f"{i+1}. {ep['connector']} (file: {ep['file']})")
         print(f"\nPlease specify the connector file using:")
         print(f"python3 get_endpoint_details.py {endpoint_name} <connector_file.json>")
-        return ""
+        return None
+
+@functools.lru_cache(maxsize=32)
+def _endpoint_index_for_file(path, mtime):
+    """Map each endpoint name in a connector file to its first matching item."""
+    index = {}
+    for item in _load_connector(path, mtime):
+        name = _endpoint_name(item)
+        if name is not None:
+            index.setdefault(name, item)
+    return index
+
+def _endpoint_name(item):
+    """Return the endpoint name of a connector item, or None if it has none."""
+    # The slackConnectors.json has a different structure
+    if 'node' in item:
+        return item['node']['name']
+    return item.get('name')
+
+def _build_endpoint_index():
+    """
+    Build (or reuse) the endpoint-name index over every connector in connectorDetails.md.
+
+    The index is rebuilt whenever the markdown file or any connector file it
+    references changes on disk.
+
+    Returns:
+        dict: Endpoint name -> list of (connector_name, file_name, item) tuples.
+              The index and its items are shared cache state; treat them as read-only.
+    """
+    global _index_key
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    markdown_file_path = os.path.join(script_dir, 'connectorDetails.md')
+
+    with _index_lock:
+        with open(markdown_file_path, 'r') as f:
+            content = f.read()
+        connectors = [
+            (match.group(1).strip(), match.group(2), os.path.join(script_dir, match.group(2)))
+            for match in _CONNECTOR_SECTION_RE.finditer(content)
+        ]
+        key = (os.path.getmtime(markdown_file_path),) + tuple(
+            os.path.getmtime(path) if os.path.exists(path) else None
+            for _, _, path in connectors
+        )
+        if key == _index_key:
+            return INDEX
+
+        INDEX.clear()
+        for (connector_name, json_file_name, json_file_path), mtime in zip(connectors, key[1:]):
+            if mtime is None:
+                print(f"Error: {json_file_path} not found.")
+                continue
+            try:
+                file_index = _endpoint_index_for_file(json_file_path, mtime)
+            except Exception as e:
+                print(f"Error reading {json_file_path}: {e}")
+                continue
+            for name, item in file_index.items():
+                INDEX[name].append((connector_name, json_file_name, item))
+        _index_key = key
+        return INDEX
 
-def _search_endpoint_in_file(json_file_path, endpoint_name, return_data=False):
+def _search_endpoint_in_file(json_file_path, endpoint_name):
     """
     Search for an endpoint in a specific JSON file.
     
     Args:
         json_file_path (str): Path to the JSON file to search
         endpoint_name (str): Name of the endpoint to find
-        return_data (bool): If True, return the data instead of printing
     
     Returns:
-        dict or None: Endpoint data if found and return_data=True, otherwise None
+        dict or None: Endpoint data if found (cached, read-only), otherwise None
     """
     try:
-        with open(json_file_path, 'r') as jf:
-            data = json.load(jf)
-            for item in data:
-                # The slackConnectors.json has a different structure
-                if 'node' in item:
-                    if item['node']['name'] == endpoint_name:
-                        if return_data:
-                            return item
-                        else:
-                            print(json.dumps(item, indent=2))
-                            return True
-                else:
-                    if 'name' in item and item['name'] == endpoint_name:
-                        if return_data:
-                            return item
-                        else:
-                            print(json.dumps(item, indent=2))
-                            return True
+        return _endpoint_index_for_file(json_file_path, os.path.getmtime(json_file_path)).get(endpoint_name)
     except Exception as e:
         print(f"Error reading {json_file_path}: {e}")
         
@@ -123,4 +175,6 @@ if __name__ == "__main__":
 
     endpoint_name_to_find = sys.argv[1]
     connector_file = sys.argv[2] if len(sys.argv) == 3 else None
-    get_endpoint_details(endpoint_name_to_find, connector_file)
\ No newline at end of file
+    endpoint_details = get_endpoint_details(endpoint_name_to_find, connector_file)
+    if endpoint_details is not None:
+        print(json.dumps(endpoint_details, indent=2))
\ No newline at end of file